@@ -1,11 +1,75 @@
+import os
 import tkinter as tk
+import weakref
+from functools import cache, partial
 from tkinter import filedialog  # For masters task
 from typing import Callable, Union, Optional
+from PIL import Image, ImageTk
 from a3_support import *
 from model import *
 from constants import *
 
 
+def _blit_tiles(dest, tiles, ground_idx, cell_height, cell_width):
+    """
+    Copies tiles[ground_idx[row, col]] into the cell at (row, col) of dest,
+    leaving cells with a negative index untouched. This is only ever run once
+    compiled by numba, see _load_blit_kernel.
+
+    Args:
+        dest: The (height, width, 4) RGBA array to copy the tiles into.
+        tiles: The (#tiles, cell_height, cell_width, 4) tile images.
+        ground_idx: The (#rows, #columns) index into tiles of each cell.
+        cell_height: The height of each cell in pixels.
+        cell_width: The width of each cell in pixels.
+    """
+    rows, cols = ground_idx.shape
+    channels = dest.shape[2]
+    for row in range(rows):
+        y_min = row * cell_height
+        for col in range(cols):
+            idx = ground_idx[row, col]
+            if idx >= 0:
+                x_min = col * cell_width
+                tile = tiles[idx]
+                # plain loops compile to a much tighter copy than slicing
+                for y in range(cell_height):
+                    dest_row = dest[y_min + y]
+                    tile_row = tile[y]
+                    for x in range(cell_width):
+                        for channel in range(channels):
+                            dest_row[x_min + x, channel] = tile_row[x, channel]
+
+
+@cache
+def _load_blit_kernel() -> Optional[Callable]:
+    """
+    Imports numba the first time a large map needs it, rather than on every
+    start, and compiles _blit_tiles with it. The compiled kernel is cached on
+    disk, so later runs skip compiling.
+
+    Returns:
+        The compiled _blit_tiles, or None if numba is not installed.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # the ground image is pasted together with PIL instead
+        return None
+    return njit(cache=True)(_blit_tiles)
+
+
+# PhotoImages shared by every FarmView, keyed by (image path, cell size). Views
+# hold the images they use, so entries are dropped once no view needs them.
+_IMAGE_CACHE = weakref.WeakValueDictionary()
+
+# characters that have an image, and so are drawn when they appear in the map
+_KNOWN_TILES = frozenset(IMAGES)
+
+# InfoBar headings, and the format used for the value shown under each one
+_INFO_HEADERS = ("Day:", "Money:", "Energy:")
+_INFO_FMTS = ("{}", "${}", "{}")
+
+
 # Implement your classes here
 class InfoBar(AbstractGrid):
     """
@@ -25,30 +89,38 @@ class InfoBar(AbstractGrid):
         super().__init__(master, dimensions=(2, 3),
                          size=(FARM_WIDTH + INVENTORY_WIDTH, INFO_BAR_HEIGHT))
 
+        # the headings never change, so they are only drawn once
+        for i, info in enumerate(_INFO_HEADERS):
+            self.annotate_position(position=(0, i), text=info,
+                                   font=HEADING_FONT)
+
+        # day, money and energy labels, in the same order as _INFO_HEADERS
+        self._value_labels = tuple(
+            self.create_text(self.get_midpoint((1, i)), text="", font=None)
+            for i in range(len(_INFO_HEADERS)))
+
     def redraw(self, day: int, money: int, energy: int) -> None:
         """
-        Clears the InfoBar and redraws it to display the provided day, money,
-        and energy.
+        Updates the InfoBar to display the provided day, money, and energy.
 
         Args:
             day: The current day
             money: The amount of money the player has
             energy: The amount of energy the player has
         """
-        self.clear()
-
-        information = [("Day:", f"{day}"), ("Money:", f"${money}"),
-                       ("Energy:", f"{energy}")]
-        for i, (info, amount) in enumerate(information):
-            self.annotate_position(position=(0, i), text=info,
-                                   font=HEADING_FONT)
-            self.annotate_position(position=(1, i), text=amount, font=None)
+        for label, fmt, value in zip(self._value_labels, _INFO_FMTS,
+                                     (day, money, energy)):
+            self.itemconfigure(label, text=fmt.format(value))
 
 
 class FarmView(AbstractGrid):
     """
     The FarmView is a grid displaying the farm map, player, and plants.
     """
+    # fewest cells for which the numba kernel builds the ground faster than
+    # PIL. The canvas size is fixed, so PIL's per-cell paste calls are what
+    # grow with the map; PIL was faster at 20x20 and the kernel at 21x21.
+    _BLIT_MIN_CELLS = 21 * 21
 
     def __init__(self, master: tk.Tk | tk.Frame, dimensions: tuple[int, int],
                  size: tuple[int, int], **kwargs) -> None:
@@ -65,13 +137,280 @@ class FarmView(AbstractGrid):
         """
         super().__init__(master, dimensions, size, **kwargs)
 
-        self._cache = {}
+        # PhotoImages used by this view, keyed by what they show, e.g.
+        # ("player", UP) or ("plant", "kale", 3). These keep the shared
+        # _IMAGE_CACHE entries alive for as long as this view needs them.
+        self._by_key: dict[tuple, ImageTk.PhotoImage] = {}
+        self._photo_cell_size = self.get_cell_size()
+
+        # resized ground tiles, pasted together into a single ground image
+        self._tile_images: dict[str, Image.Image] = {}
+        # pixel arrays of the same tiles, used by the numba kernel
+        self._tile_arrays: dict[str, 'numpy.ndarray'] = {}
+
+        # canvas items currently drawn, so redraws only touch what changed
+        self._ground_item: Optional[int] = None
+        self._ground_photo: Optional[ImageTk.PhotoImage] = None
+        self._drawn_ground: Optional[list[str]] = None
+        self._plant_items: dict[tuple[int, int], tuple[int, str, int]] = {}
+        self._player_item: Optional[int] = None
+
+        # the midpoint of every cell, indexed [row][col]
+        self._midpoints: list[list[tuple[int, int]]] = []
+        self._midpoints_key: Optional[tuple] = None
+
+    def _refresh_cell_size(self) -> None:
+        """
+        Discards every cached image and drawn canvas item if the cell size has
+        changed since they were created, as they would all be the wrong size.
+        """
+        cell_size = self.get_cell_size()
+        if cell_size == self._photo_cell_size:
+            return
+
+        self._by_key.clear()
+        self._tile_images.clear()
+        self._tile_arrays.clear()
+        self._photo_cell_size = cell_size
+
+        self.clear()
+        self._ground_item = None
+        self._ground_photo = None
+        self._drawn_ground = None
+        self._plant_items.clear()
+        self._player_item = None
+
+    def _image(self, image_name: str) -> ImageTk.PhotoImage:
+        """
+        Returns the PhotoImage for the given image path at the current cell
+        size, only loading it if no FarmView already has it loaded.
+
+        Args:
+            image_name: The path to the image to load.
+
+        Returns:
+            The image for the given path, sized to fit a single cell.
+        """
+        key = (image_name, self._photo_cell_size)
+        image = _IMAGE_CACHE.get(key)
+        if image is None:
+            # get_image caches by path alone, so sizes are kept apart here
+            image = get_image(image_name, self._photo_cell_size)
+            _IMAGE_CACHE[key] = image
+        return image
+
+    def _refresh_midpoints(self) -> None:
+        """
+        Recalculates the midpoint of every cell if the dimensions or cell size
+        have changed since they were last calculated.
+        """
+        key = (self._dimensions, self._photo_cell_size)
+        if key == self._midpoints_key:
+            return
+
+        rows, cols = self._dimensions
+        get_midpoint = self.get_midpoint
+        self._midpoints = [[get_midpoint((row, col)) for col in range(cols)]
+                           for row in range(rows)]
+        self._midpoints_key = key
+
+    def _tile_image(self, tile: str) -> Image.Image:
+        """
+        Returns the image for the given ground tile, resized to fit a single
+        cell, loading it the first time the tile is used.
+
+        Args:
+            tile: The ground tile to get the image for.
+
+        Returns:
+            The RGBA image for the tile.
+        """
+        image = self._tile_images.get(tile)
+        if image is None:
+            image = Image.open(self._image_path(("tile", tile))).resize(
+                self._photo_cell_size).convert("RGBA")
+            self._tile_images[tile] = image
+        return image
+
+    def _tile_array(self, tile: str) -> 'numpy.ndarray':
+        """
+        Returns the pixels of the image for the given ground tile as a
+        (cell_height, cell_width, 4) array, converting it the first time the
+        tile is used.
+
+        Args:
+            tile: The ground tile to get the pixels for.
+
+        Returns:
+            The RGBA pixel array for the tile.
+        """
+        import numpy as np
+
+        array = self._tile_arrays.get(tile)
+        if array is None:
+            array = np.asarray(self._tile_image(tile), dtype=np.uint8)
+            self._tile_arrays[tile] = array
+        return array
+
+    def _paste_ground(self, ground: list[str], cols: int) -> Image.Image:
+        """
+        Builds the ground image by pasting each tile image into place with PIL.
+
+        Args:
+            ground: The list of ground tiles.
+            cols: The number of columns in the widest row of ground.
+
+        Returns:
+            The RGBA image of the whole ground.
+        """
+        cell_width, cell_height = self._photo_cell_size
+        composite = Image.new("RGBA", (cols * cell_width,
+                                       len(ground) * cell_height))
+
+        paste = composite.paste
+        # tiles without an image are simply missing, so one lookup per cell
+        # both checks the tile and finds its image
+        tile_images = {tile: self._tile_image(tile) for tile
+                       in _KNOWN_TILES.intersection("".join(ground))}
+        for row, tiles in enumerate(ground):
+            y_min = row * cell_height
+            for col, tile in enumerate(tiles):
+                image = tile_images.get(tile)
+                if image is not None:
+                    paste(image, (col * cell_width, y_min))
+        return composite
+
+    def _blit_ground(self, ground: list[str], cols: int,
+                     blit_kernel: Callable) -> Image.Image:
+        """
+        Builds the ground image by copying tile pixel arrays into place with a
+        compiled kernel.
+
+        Args:
+            ground: The list of ground tiles.
+            cols: The number of columns in the widest row of ground.
+            blit_kernel: The compiled _blit_tiles from _load_blit_kernel.
+
+        Returns:
+            The RGBA image of the whole ground.
+        """
+        import numpy as np
+
+        cell_width, cell_height = self._photo_cell_size
+        known_tiles = sorted(_KNOWN_TILES.intersection("".join(ground)))
+
+        # the whole map as one (#rows, #columns) array of character codes, with
+        # short rows padded by spaces, which have no image
+        codes = np.frombuffer(
+            "".join(tiles.ljust(cols) for tiles in ground).encode(
+                "latin-1", errors="replace"),
+            dtype=np.uint8).reshape(len(ground), cols)
+
+        # maps each character code to its index in tiles, or -1 for no image
+        tile_lookup = np.full(256, -1, dtype=np.int8)
+        for idx, tile in enumerate(known_tiles):
+            tile_lookup[ord(tile)] = idx
+        ground_idx = tile_lookup[codes]
+
+        dest = np.zeros((len(ground) * cell_height, cols * cell_width, 4),
+                        dtype=np.uint8)
+        if known_tiles:
+            tiles = np.stack([self._tile_array(tile) for tile in known_tiles])
+            blit_kernel(dest, tiles, ground_idx, cell_height, cell_width)
+        return Image.fromarray(dest, "RGBA")
+
+    def _compose_ground(self, ground: list[str]) -> None:
+        """
+        Builds one image covering the whole farm from the ground tiles, and
+        shows it as the single canvas item beneath the plants and player.
+
+        Args:
+            ground: The list of ground tiles.
+        """
+        cols = max((len(tiles) for tiles in ground), default=0)
+        blit_kernel = None
+        if len(ground) * cols >= FarmView._BLIT_MIN_CELLS:
+            blit_kernel = _load_blit_kernel()
+
+        if blit_kernel is not None:
+            composite = self._blit_ground(ground, cols, blit_kernel)
+        else:
+            composite = self._paste_ground(ground, cols)
+
+        self._ground_photo = ImageTk.PhotoImage(composite)
+        if self._ground_item is None:
+            self._ground_item = self.create_image((0, 0), anchor=tk.NW,
+                                                  image=self._ground_photo)
+            # ground always sits beneath the plants and player
+            self.tag_lower(self._ground_item)
+        else:
+            self.itemconfigure(self._ground_item, image=self._ground_photo)
+
+    @staticmethod
+    def _image_path(key: tuple) -> str:
+        """
+        Returns the path of the image shown for the given image key.
+
+        Args:
+            key: ("tile", tile), ("player", direction) or
+                 ("plant", plant_name, stage).
+
+        Returns:
+            The path to the image file for the key.
+        """
+        if key[0] == "plant":
+            _, plant_name, stage = key
+            return f"images/plants/{plant_name}/stage_{stage}.png"
+        return f"images/{IMAGES[key[1]]}"
+
+    def _keyed_image(self, key: tuple) -> ImageTk.PhotoImage:
+        """
+        Returns the PhotoImage for the given image key, loading it the first
+        time the key is used.
+
+        Args:
+            key: ("player", direction) or ("plant", plant_name, stage).
+
+        Returns:
+            The image for the key, sized to fit a single cell.
+        """
+        image = self._by_key.get(key)
+        if image is None:
+            image = self._image(self._image_path(key))
+            self._by_key[key] = image
+        return image
+
+    def preload_images(self, tiles: list[str], directions: list[str],
+                       plant_names: list[str]) -> None:
+        """
+        Loads every image the FarmView may need up front, so that redraws never
+        have to load one. Each plant's stages are loaded from stage 1 until no
+        image exists for the next stage.
+
+        Args:
+            tiles: The ground tiles that can appear on the map.
+            directions: The directions the player can face.
+            plant_names: The name of each type of plant.
+        """
+        self._refresh_cell_size()
+        for tile in tiles:
+            self._tile_image(tile)
+        for direction in directions:
+            self._keyed_image(("player", direction))
+        for plant_name in plant_names:
+            stage = 1
+            while os.path.exists(self._image_path(("plant", plant_name,
+                                                   stage))):
+                self._keyed_image(("plant", plant_name, stage))
+                stage += 1
 
     def redraw(self, ground: list[str], plants: dict[tuple[int, int], 'Plant'],
                player_position: tuple[int, int], player_direction: str) -> None:
         """
-        Clears the farm view, then creates (on the FarmView instance) the images
-        for the ground, then the plants, then the player.
+        Updates the images on the FarmView for the ground, then the plants, then
+        the player. Canvas items are kept between redraws, so only the parts
+        that have changed since the last redraw are touched. The whole ground
+        is drawn as one image, rebuilt only when a tile changes.
 
         Args:
             ground: The list of ground tiles.
@@ -79,31 +418,57 @@ class FarmView(AbstractGrid):
             player_position: The current position of the player as a tuple.
             player_direction: The direction the player is facing.
         """
-        self.clear()
+        self._refresh_cell_size()
+        self._refresh_midpoints()
+        midpoints = self._midpoints
+        create_image = self.create_image
+        itemconfigure = self.itemconfigure
 
-        # drawing ground
-        for row, tiles in enumerate(ground):
-            for col, tile in enumerate(tiles):
-                position = (row, col)
-                if tile in IMAGES:
-                    image = get_image(f"images/{IMAGES[tile]}",
-                                      self.get_cell_size(), self._cache)
-                    self.create_image(self.get_midpoint(position), image=image)
+        # drawing ground, which is only recomposed when a tile has changed
+        if ground != self._drawn_ground:
+            self._compose_ground(ground)
+            # the model edits its map in place, so keep a copy to compare with
+            self._drawn_ground = list(ground)
+
+        # removing plants that are no longer on the farm
+        plant_items = self._plant_items
+        for position in list(plant_items):
+            if position not in plants:
+                self.delete(plant_items.pop(position)[0])
 
         # drawing plants
-        for position in plants:
-            plant_name = plants[position].get_name()
-            plant_stage = plants[position].get_stage()
-            image = get_image(f"images/plants/{plant_name}/stage_"
-                              f"{plant_stage}.png",
-                              self.get_cell_size(), self._cache)
-            self.create_image(self.get_midpoint(position), image=image)
+        for position, plant in plants.items():
+            plant_name = plant.get_name()
+            plant_stage = plant.get_stage()
+            drawn = plant_items.get(position)
+            if drawn is not None and drawn[1:] == (plant_name, plant_stage):
+                continue
+
+            image = self._keyed_image(("plant", plant_name, plant_stage))
+            if drawn is None:
+                row, col = position
+                item = create_image(midpoints[row][col], image=image)
+            else:
+                item = drawn[0]
+                itemconfigure(item, image=image)
+            plant_items[position] = (item, plant_name, plant_stage)
 
         # drawing player position
-        if player_direction in IMAGES:
-            image = get_image(f"images/{IMAGES[player_direction]}",
-                              self.get_cell_size(), self._cache)
-            self.create_image(self.get_midpoint(player_position), image=image)
+        if player_direction not in IMAGES:
+            if self._player_item is not None:
+                self.delete(self._player_item)
+                self._player_item = None
+            return
+
+        image = self._keyed_image(("player", player_direction))
+        row, col = player_position
+        if self._player_item is None:
+            self._player_item = create_image(midpoints[row][col], image=image)
+        else:
+            self.coords(self._player_item, *midpoints[row][col])
+            itemconfigure(self._player_item, image=image)
+        # newly created plants must not cover the player
+        self.tag_raise(self._player_item)
 
 
 class ItemView(tk.Frame):
@@ -157,24 +522,50 @@ class ItemView(tk.Frame):
                                          )
         self._buy_price_label.pack(expand=tk.TRUE, fill=tk.BOTH)
 
-        sell_button = tk.Button(self, text="Sell",
-                                command=lambda: sell_command(item_name))
+        # partial needs a callable, so callbacks that are not given are left
+        # unset and their widgets do nothing
+        on_sell = (partial(sell_command, item_name)
+                   if sell_command is not None else None)
+        sell_button = tk.Button(self, text="Sell", command=on_sell)
         sell_button.pack(side=tk.LEFT, padx=20)
 
         # Only creates a buy button for items that can be bought
         if self._buy_price_label["text"][-3:] != "N/A":
-            buy_button = tk.Button(self, text="Buy",
-                                   command=lambda: buy_command(item_name))
+            on_buy = (partial(buy_command, item_name)
+                      if buy_command is not None else None)
+            buy_button = tk.Button(self, text="Buy", command=on_buy)
             buy_button.pack(side=tk.LEFT)
 
         self.config(bg=INVENTORY_COLOUR)
 
+        # widgets recoloured together whenever the item's state changes
+        self._themed_widgets = (self._item_label, self._buy_price_label,
+                                self._sell_price_label, self._item_label_frame,
+                                self)
+        self._current_amount = amount
+        self._current_bg = INVENTORY_COLOUR
+        # this frame's border colour, which outline() can set apart from bg
+        self._current_highlight = self.cget("highlightbackground")
+
         # binds
-        widgets = [self._item_label, self._buy_price_label,
-                   self._sell_price_label, self._item_label_frame, self]
+        if select_command is not None:
+            on_select = partial(self._dispatch_select, item_name,
+                                select_command)
+            for widget in self._themed_widgets:
+                widget.bind("<Button-1>", on_select)
 
-        for widget in widgets:
-            widget.bind("<Button-1>", lambda x: select_command(item_name))
+    @staticmethod
+    def _dispatch_select(item_name: str, select_command: Callable[[str], None],
+                         event: tk.Event) -> None:
+        """
+        Calls select_command with the item name when the ItemView is clicked.
+
+        Args:
+            item_name: The name of the item that was clicked.
+            select_command: The callback to execute for item selection.
+            event: The click event object.
+        """
+        select_command(item_name)
 
     def update(self, amount: int, selected: bool = False) -> None:
         """
@@ -186,8 +577,6 @@ class ItemView(tk.Frame):
             selected: Indicates whether the item is currently selected. Defaults
                       to False.
         """
-
-        self._item_label.config(text=f"{self._item_name}: {amount}")
         if amount == 0:
             new_colour = INVENTORY_EMPTY_COLOUR
         elif selected:
@@ -195,11 +584,33 @@ class ItemView(tk.Frame):
         else:
             new_colour = INVENTORY_COLOUR
 
-        widgets = [self._item_label, self._buy_price_label,
-                   self._sell_price_label, self._item_label_frame, self]
-        for widget in widgets:
-            widget.config(bg=new_colour,
-                          highlightbackground=new_colour)
+        # nothing to reconfigure if the item looks the same as before
+        if (amount == self._current_amount and new_colour == self._current_bg
+                and new_colour == self._current_highlight):
+            return
+
+        if amount != self._current_amount:
+            self._item_label.config(text=f"{self._item_name}: {amount}")
+            self._current_amount = amount
+
+        if new_colour != self._current_bg:
+            for widget in self._themed_widgets:
+                widget.config(bg=new_colour,
+                              highlightbackground=new_colour)
+            self._current_bg = new_colour
+        elif new_colour != self._current_highlight:
+            # only this frame's border was changed, by outline()
+            self.config(highlightbackground=new_colour)
+        self._current_highlight = new_colour
+
+    def outline(self) -> None:
+        """
+        Draws a border around this ItemView, which lasts until its colour is
+        next updated.
+        """
+        self.config(highlightbackground=INVENTORY_OUTLINE_COLOUR,
+                    highlightthickness=2)
+        self._current_highlight = INVENTORY_OUTLINE_COLOUR
 
 
 class FarmGame(object):
@@ -209,6 +620,10 @@ class FarmGame(object):
     classes, event handling, and facilitating communication between the model
     and view classes.
     """
+    # maps each plant name to the class used to create that plant
+    _PLANT_CTORS = {plant().get_name(): plant
+                    for plant in (PotatoPlant, KalePlant, BerryPlant)}
+
     def __init__(self, master: tk.Tk, map_file: str) -> None:
         """
         Sets up the FarmGame by creating the banner, the FarmModel instance, the
@@ -220,6 +635,11 @@ class FarmGame(object):
             map_file: The file path to the map file.
         """
         master.title("Farm Game")
+        self._master = master
+        self._redraw_scheduled = False
+        self._farm_dirty = False
+        # items whose ItemView is outlined, which the next selection clears
+        self._outlined_items: set[str] = set()
 
         # creates the title banner
         self._header = get_image(image_name="images/header.png",
@@ -242,42 +662,28 @@ class FarmGame(object):
         self._farm_view = FarmView(frame, self._farm.get_dimensions(),
                                    (FARM_WIDTH, 480))
         self._farm_view.pack(side=tk.LEFT)
+        self._farm_view.preload_images(
+            tiles=[GRASS, SOIL, UNTILLED], directions=list(MOVE_DELTAS),
+            plant_names=list(FarmGame._PLANT_CTORS))
 
-        # ItemView instance
-        inventory_items = []
-        item_frames = []
+        # ItemView instances
         self._inventory_frames = {}   # dict[item_name, Frame]
 
-        # Create frames for items in inventory
         for item_name in ITEMS:
+            amount = self._inventory.get(item_name, 0)
+            item_frame = ItemView(frame, item_name=item_name, amount=amount,
+                                  sell_command=self.sell_item,
+                                  select_command=self.select_item,
+                                  buy_command=self.buy_item)
             if item_name in self._inventory:
-                item_frame = ItemView(frame, item_name=item_name,
-                                      amount=self._inventory[item_name],
-                                      sell_command=self.sell_item,
-                                      select_command=self.select_item,
-                                      buy_command=self.buy_item)
-                item_frame.config(highlightbackground=INVENTORY_OUTLINE_COLOUR,
-                                  highlightthickness=2)
-                item_frames.append(item_frame)
-                item_frame.pack(expand=tk.TRUE, fill=tk.BOTH)
-                inventory_items.append(item_name)
-
-                if self._inventory[item_name] == 0:
-                    item_frame.update(0, False)
-
-                self._inventory_frames[item_name] = item_frame
-
-        # Create frames for items not in inventory
-        for item in ITEMS:
-            if item not in inventory_items:
-                item_frame = ItemView(frame, item_name=item, amount=0,
-                                      sell_command=self.sell_item,
-                                      select_command=self.select_item,
-                                      buy_command=self.buy_item)
+                item_frame.outline()
+                self._outlined_items.add(item_name)
+            item_frame.pack(expand=tk.TRUE, fill=tk.BOTH)
+
+            if amount == 0:
                 item_frame.update(0, False)
-                item_frame.pack(expand=tk.TRUE, fill=tk.BOTH)
 
-                self._inventory_frames[item] = item_frame
+            self._inventory_frames[item_name] = item_frame
 
         # instance of InfoBar
         self._info_bar = InfoBar(master)
@@ -288,6 +694,12 @@ class FarmGame(object):
         self._day_btn.pack()
 
         # binds
+        self._key_handlers = {"t": self._do_till, "u": self._do_untill,
+                              "p": self._do_plant, "r": self._do_remove,
+                              "h": self._do_harvest}
+        for direction in MOVE_DELTAS:
+            self._key_handlers[direction] = partial(self._farm.move_player,
+                                                    direction)
         master.bind("<KeyPress>", self.handle_keypress)
 
         self.redraw()
@@ -297,16 +709,51 @@ class FarmGame(object):
         updates the display and proceeds to the next day in the FarmGame
         """
         self._farm.new_day()
-        self.redraw()
+        self._schedule_redraw()
+
+    def _schedule_redraw(self, farm: bool = True) -> None:
+        """
+        Schedules a redraw for the next time Tk is idle. Any further requests
+        made before then are merged into that single redraw.
+
+        Args:
+            farm: Whether the farm view needs redrawing as well as the InfoBar.
+                  Defaults to True.
+        """
+        self._farm_dirty = self._farm_dirty or farm
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self._master.after_idle(self._do_redraw)
+
+    def _do_redraw(self) -> None:
+        """
+        Performs a redraw previously scheduled by _schedule_redraw.
+        """
+        self._redraw_scheduled = False
+        self.redraw_info()
+        if self._farm_dirty:
+            self._farm_dirty = False
+            self.redraw_farm()
 
     def redraw(self) -> None:
         """
         Redraws the entire game based on the current model state.
         """
+        self.redraw_info()
+        self.redraw_farm()
+
+    def redraw_info(self) -> None:
+        """
+        Redraws the InfoBar based on the current model state.
+        """
         self._info_bar.redraw(self._farm.get_days_elapsed()
                               , self._farm.get_player().get_money()
                               , self._farm.get_player().get_energy())
 
+    def redraw_farm(self) -> None:
+        """
+        Redraws the FarmView based on the current model state.
+        """
         self._farm_view.redraw(self._farm.get_map(),
                                self._farm.get_plants(),
                                self._farm.get_player_position(),
@@ -324,16 +771,12 @@ class FarmGame(object):
             str or None: The tile at the specified position if a match is found,
             otherwise None is returned
         """
-
-        position_tile = {}
-        for row, tiles in enumerate(self._farm.get_map()):
-            for col, tile in enumerate(tiles):
-                tile_position = (row, col)
-                if tile in IMAGES:
-                    position_tile[tile_position] = tile
-
-        if position in position_tile:
-            return position_tile[position]
+        row, col = position
+        ground = self._farm.get_map()
+        if 0 <= row < len(ground) and 0 <= col < len(ground[row]):
+            tile = ground[row][col]
+            if tile in IMAGES:
+                return tile
 
     @staticmethod
     def create_plants(plant_name: str) -> Plant | None:
@@ -347,11 +790,9 @@ class FarmGame(object):
             Plant or None: The created plant object if a match is found,
             otherwise None.
         """
-
-        plants = [PotatoPlant(), KalePlant(), BerryPlant()]
-        for plant in plants:
-            if plant_name == plant.get_name():
-                return plant
+        plant = FarmGame._PLANT_CTORS.get(plant_name)
+        if plant is not None:
+            return plant()
 
     def update_inv_frame(self, plant_name: str, selected: bool) -> None:
         """
@@ -366,59 +807,75 @@ class FarmGame(object):
             amount = self._inventory[plant_name]
             self._inventory_frames[plant_name].update(amount, selected)
 
-    def handle_keypress(self, event: tk.Event) -> None:
+    def _do_till(self) -> None:
         """
-        An event handler to be called when a keypress event occurs.
-
-        Args:
-            event: The keypress event object.
+        Tills the soil at the player's position.
         """
-        moves = ["w", "a", "s", "d", "t", "u", "p", "r", "h"]
-        if event.keysym in moves:
-            if event.keysym == "t":
-                self._farm.till_soil(self._farm.get_player_position())
-                self.redraw()
-
-            elif event.keysym == "u":
-                self._farm.untill_soil(self._farm.get_player_position())
-                self.redraw()
+        self._farm.till_soil(self._farm.get_player_position())
 
-            elif event.keysym == "p":
-                position = self._farm.get_player().get_position()
-                plant = self._farm.get_player().get_selected_item()
+    def _do_untill(self) -> None:
+        """
+        Untills the soil at the player's position.
+        """
+        self._farm.untill_soil(self._farm.get_player_position())
 
-                if self.inspect_ground(position) == SOIL and plant:
-                    # checks if the item is in inventory and a seed
-                    if plant in self._inventory and "Seed" in plant:
-                        selected_plant = plant.split()[0].lower()
-                        created_plant = self.create_plants(selected_plant)
+    def _do_plant(self) -> None:
+        """
+        Plants the selected seed at the player's position, if it is tilled soil
+        and the player has the seed, and updates the seed's ItemView.
+        """
+        player = self._farm.get_player()
+        inv = self._inventory
+        frames = self._inventory_frames
+        position = player.get_position()
+        plant = player.get_selected_item()
 
-                        if self._farm.add_plant(position, created_plant):
-                            self._farm.get_player().remove_item((plant, 1))
+        if plant and self.inspect_ground(position) == SOIL:
+            plant_in_inv = plant in inv
+            # checks if the item is in inventory and a seed
+            if plant_in_inv and "Seed" in plant:
+                selected_plant = plant.split()[0].lower()
+                created_plant = self.create_plants(selected_plant)
 
-                    if plant not in self._inventory:
-                        self._inventory_frames[plant].update(0, False)
+                if self._farm.add_plant(position, created_plant):
+                    player.remove_item((plant, 1))
+                    plant_in_inv = plant in inv
 
-                    if plant in self._inventory:  # to prevent KeyError
-                        self.update_inv_frame(plant, True)
+            if not plant_in_inv:
+                frames[plant].update(0, False)
+            elif plant in frames:
+                frames[plant].update(inv[plant], True)
 
-                self.redraw()
+    def _do_remove(self) -> None:
+        """
+        Removes the plant at the player's position.
+        """
+        self._farm.remove_plant(self._farm.get_player().get_position())
 
-            elif event.keysym == "r":
-                self._farm.remove_plant(self._farm.get_player().get_position())
-                self.redraw()
+    def _do_harvest(self) -> None:
+        """
+        Harvests the plant at the player's position, adding the harvested items
+        to the player's inventory.
+        """
+        player = self._farm.get_player()
+        plant_harvested = self._farm.harvest_plant(player.get_position())
+        if plant_harvested:
+            item_name = plant_harvested[0]
+            player.add_item(plant_harvested)
+            self.update_inv_frame(
+                item_name, item_name == player.get_selected_item())
 
-            elif event.keysym == "h":
-                position = self._farm.get_player().get_position()
-                plant_harvested = self._farm.harvest_plant(position)
-                if plant_harvested:
-                    self._farm.get_player().add_item(plant_harvested)
-                    self.update_inv_frame(plant_harvested[0], False)
-                self.redraw()
+    def handle_keypress(self, event: tk.Event) -> None:
+        """
+        An event handler to be called when a keypress event occurs.
 
-            else:
-                self._farm.move_player(event.keysym)
-                self.redraw()
+        Args:
+            event: The keypress event object.
+        """
+        handler = self._key_handlers.get(event.keysym)
+        if handler is not None:
+            handler()
+            self._schedule_redraw()
 
     def select_item(self, item_name: str) -> None:
         """
@@ -427,13 +884,22 @@ class FarmGame(object):
         Args:
             item_name: the name of the selected item
         """
+        player = self._farm.get_player()
+        previous = player.get_selected_item()
+        if item_name == previous and not self._outlined_items:
+            return
+
         if item_name in self._inventory_frames and item_name in self._inventory:
-            self._farm.get_player().select_item(item_name)
+            player.select_item(item_name)
 
-            for item, frame in self._inventory_frames.items():
+            # only the old and new selections, and any outlined frames, change
+            # how they look
+            for item in self._outlined_items | {previous, item_name}:
                 if item in self._inventory:
-                    frame.update(self._inventory[item], item == item_name)
-        self.redraw()
+                    self._inventory_frames[item].update(self._inventory[item],
+                                                        item == item_name)
+            self._outlined_items.clear()
+        self._schedule_redraw(farm=False)
 
     def buy_item(self, item_name: str) -> None:
         """
@@ -442,16 +908,17 @@ class FarmGame(object):
         Args:
             item_name: the name of the item to buy
         """
-        self._farm.get_player().buy(item_name, BUY_PRICES[item_name])
+        player = self._farm.get_player()
+        player.buy(item_name, BUY_PRICES[item_name])
 
         if item_name not in self._inventory:
-            self._farm.get_player().add_item((item_name, 0))
+            player.add_item((item_name, 0))
         else:
-            self.update_inv_frame(item_name, False)
-            self._inventory_frames[item_name].config(
-                highlightbackground=INVENTORY_OUTLINE_COLOUR,
-                highlightthickness=2)
-        self.redraw()
+            self.update_inv_frame(item_name,
+                                  item_name == player.get_selected_item())
+            self._inventory_frames[item_name].outline()
+            self._outlined_items.add(item_name)
+        self._schedule_redraw(farm=False)
 
     def sell_item(self, item_name: str) -> None:
         """
@@ -460,13 +927,15 @@ class FarmGame(object):
         Args:
             item_name: the name of the item to sell
         """
-        self._farm.get_player().sell(item_name, SELL_PRICES[item_name])
+        player = self._farm.get_player()
+        player.sell(item_name, SELL_PRICES[item_name])
 
         if item_name not in self._inventory:
             self._inventory_frames[item_name].update(0, False)
         else:
-            self.update_inv_frame(item_name, False)
-        self.redraw()
+            self.update_inv_frame(item_name,
+                                  item_name == player.get_selected_item())
+        self._schedule_redraw(farm=False)
 
 
 def play_game(root: tk.Tk, map_file: str) -> None: